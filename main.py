@@ -1,16 +1,46 @@
+import ast
+import functools
+import io
+import math
+import os
+import random as rd
+import re
+import tempfile
 import streamlit as st
 import soporte.simulacion as sim
+import soporte.almacen as almacen
+import soporte.exportacion as exportacion
+import soporte.historial as historial
+import soporte.cuantiles as cuantiles
+import soporte.uniformes as uniformes
+import soporte.compilado as compilado
 from plotly import graph_objs as go
 
 
 # Título de la aplicación
 st.title("Generador de Números Aleatorios")
 
+# Verificación del backend compilado (una única vez por proceso)
+jit_disponible, jit_estado = compilado.verificar_backend()
+st.sidebar.caption(f"Backend compilado: {jit_estado}")
+
 # Entrada de parámetros
 distribucion = {"Normal": "N",
                 "Uniforme": "U",
                 "Exponencial": "EN",
-                "Poisson": "P"}
+                "Poisson": "P",
+                "Binomial": "B",
+                "Empírica (archivo)": "E",
+                "Personalizada (FDA)": "FDA"}
+
+fuentes_uniformes = {"Aleatoria (rd.random)": "A",
+                     "Estratificada": "ES",
+                     "Hipercubo latino": "HL",
+                     "Sobol aleatorizada": "SB"}
+
+modos_intervalos = {"Cantidad fija": "F",
+                    "Freedman–Diaconis": "FD",
+                    "Equiprobables": "EQ"}
 
 dc = st.selectbox("Selecciona una distribución", distribucion)
 muestras = []
@@ -61,151 +91,616 @@ def crear_histograma(lista_marca, lista_frec_observada, lista_frec_esperada) ->
     return fig
 
 
+def crear_grafico_convergencia(tamanos, errores) -> go.Figure:
+    """
+    Genera un gráfico en escala logarítmica del error de cada fuente de números uniformes según el tamaño de muestra.
 
+    :param tamanos: Tamaños de muestra evaluados, a representar en el eje x.
+    :type tamanos: list[int]
+    :param errores: Error medio de cada fuente para cada tamaño, a representar en el eje y.
+    :type errores: dict[str, list[float]]
+    :return: Figura con el gráfico generado.
+    :rtype: go.Figure
+    """
 
-n = st.number_input("Tamaño de la muestra", value=10000, step=1)
+    fig = go.Figure(
+        layout=go.Layout(
+            xaxis={"title": "Tamaño de la muestra", "type": "log"},
+            yaxis={"title": "Máxima diferencia acumulada", "type": "log"}
+        )
+    )
 
-if distribucion[dc] == "N":
-        media = st.number_input("Media", value=0.0, step=0.1)
-        desv = st.number_input("Desviación estándar", value=1.0, step=0.1)
+    for nombre, lista_error in errores.items():
+        fig.add_trace(go.Scatter(x=tamanos, y=lista_error, name=nombre, mode="lines+markers"))
 
-elif distribucion[dc] == "U":
-    li = st.number_input("Valor mínimo", value=0.0, step=0.1)
-    ls = st.number_input("Valor máximo", value=1.0, step=0.1)
+    return fig
 
-elif distribucion[dc] in ["EN", "P"]:
-    lam = st.number_input("Lambda", value=5.0, step=0.1)
 
-if distribucion[dc] in ["N", "U", "EN"]:
-    intervalos = st.number_input("Cantidad de Intervalos", value=15, step=1)
+def crear_fda(expresion):
+    """
+    Genera una función de distribución acumulada a partir de una expresión en la variable x. La expresión puede usar
+    números, los operadores aritméticos y las funciones y constantes del módulo math (exp, log, erf, pi, etc.).
 
-if st.button("Generar Histograma"):
+    :param expresion: Expresión de la función de distribución, por ejemplo "1 - exp(-x / 2)".
+    :type expresion: str
+    :return: La función de distribución acumulada.
+    :rtype: Callable[[float], float]
+    """
 
-    match distribucion[dc]:
+    # Las funciones de math se envuelven para que siempre devuelvan reales. Algunas (floor, ceil, trunc, factorial,
+    # comb, etc.) devuelven enteros, con los que una potencia o una combinatoria enorme se calcula con precisión
+    # arbitraria y bloquea la aplicación. Con todos los valores reales, esas operaciones fallan por desbordamiento y las
+    # funciones que solo aceptan enteros fallan con TypeError.
+
+    def como_real(funcion):
+        return lambda *argumentos: float(funcion(*argumentos))
+
+    nombres = {nombre: como_real(valor) if callable(valor) else valor
+               for nombre, valor in vars(math).items() if not nombre.startswith("_")}
+
+    try:
+        arbol = ast.parse(expresion, mode="eval")
+    except SyntaxError:
+        raise ValueError(f"La expresión no es válida: {expresion}") from None
+
+    # Se recorre el árbol de la expresión y se rechaza todo elemento que no sea un número, la variable x, un nombre del
+    # módulo math, una operación aritmética o una llamada a una función de math. Las constantes enteras
+    # se convierten a reales, por lo que ningún valor de la expresión es un entero.
+
+    for nodo in ast.walk(arbol):
+        match nodo:
+            case ast.Expression() | ast.BinOp() | ast.UnaryOp() | ast.Load():
+                pass
+            case ast.Add() | ast.Sub() | ast.Mult() | ast.Div() | ast.Pow() | ast.Mod() | ast.FloorDiv():
+                pass
+            case ast.UAdd() | ast.USub():
+                pass
+            case ast.Constant(value=valor) if type(valor) in (int, float):
+                nodo.value = float(valor)
+            case ast.Name(id=nombre) if nombre == "x" or nombre in nombres:
+                pass
+            case ast.Call(func=ast.Name(id=nombre), keywords=[]) if callable(nombres.get(nombre)):
+                pass
+            case ast.Call(func=ast.Name(id=nombre), keywords=[]):
+                raise ValueError(f"Función desconocida en la expresión: {nombre}")
+            case ast.Name(id=nombre):
+                raise ValueError(f"Nombre desconocido en la expresión: {nombre}")
+            case _:
+                raise ValueError(f"La expresión contiene un elemento no permitido: {type(nodo).__name__}")
+
+    # El árbol validado solo puede evaluar funciones de math, por lo que se compila y evalúa sin funciones integradas
+
+    codigo = compile(arbol, "<fda>", "eval")
+
+    def fda(x):
+        return eval(codigo, {"__builtins__": {}}, {**nombres, "x": float(x)})
+
+    return fda
+
+
+def leer_muestra(archivo) -> list[int]:
+    """
+    Lee una muestra de valores enteros desde un archivo subido. Si el archivo no contiene una muestra válida, se
+    informa el error y se detiene la ejecución.
 
-        case "U":
+    :param archivo: Archivo de texto con los valores separados por espacios, comas, punto y coma o saltos de línea.
+    :type archivo: UploadedFile
+    :return: Los valores de la muestra.
+    :rtype: list[int]
+    """
 
-            # Generación de muestras
-            serie = sim.generar_serie_uniforme(int(n), float(li), float(ls))
+    try:
+        texto = archivo.getvalue().decode("utf-8")
+        muestra = [int(valor) for valor in re.split(r"[\s,;]+", texto) if valor]
+    except ValueError as error:
+        st.error(f"El archivo no contiene una muestra de valores enteros: {error}")
+        st.stop()
 
-            # Cálculo de parámetros
-            cant_muestras, media, varianza, desv_est = sim.calcular_parametros(serie)
+    if not muestra:
+        st.error("El archivo no contiene valores")
+        st.stop()
 
-            # Generación de intervalos, frecuencias observadas y esperadas
-            lista_li, lista_ls, lista_marca, lista_fo = sim.generar_intervalos_dist_continua(serie, int(intervalos))
-            lista_fe = sim.calcular_frecuencia_esperada_uniforme(cant_muestras, int(intervalos))
+    return muestra
 
-        case "N":
 
-            # Generación de muestras
-            serie = sim.generar_serie_normal(int(n), float(media), float(desv))
+def leer_archivo(ruta) -> bytes:
+    """
+    Lee el contenido de un archivo de exportación. Se usa como función diferida de los botones de descarga, que la
+    ejecutan recién cuando el usuario hace clic.
 
-            # Cálculo de parámetros
-            cant_muestras, media, varianza, desv_est = sim.calcular_parametros(serie)
+    :param ruta: Ruta del archivo a leer.
+    :type ruta: str
+    :return: El contenido del archivo.
+    :rtype: bytes
+    """
+
+    with open(ruta, "rb") as archivo:
+        return archivo.read()
 
-            # Generación de intervalos, frecuencias observadas y esperadas
-            lista_li, lista_ls, lista_marca, lista_fo = sim.generar_intervalos_dist_continua(serie, int(intervalos))
-            lista_fe = sim.calcular_frecuencia_esperada_normal(lista_li, lista_ls, lista_marca, cant_muestras, media,
-                                                               desv_est)
 
-        case "EN":
+def resultados_json(datos_frecuencia, datos_chi2, datos_ks) -> str:
+    """
+    Genera el JSON con las frecuencias y los resultados de las pruebas de bondad de ajuste.
+
+    :param datos_frecuencia: Diccionario con los datos de frecuencias.
+    :type datos_frecuencia: dict[str, list[float]]
+    :param datos_chi2: Diccionario con los datos de la prueba de chi2.
+    :type datos_chi2: dict[str, float]
+    :param datos_ks: Diccionario con los datos de la prueba de ks.
+    :type datos_ks: dict[str, float]
+    :return: El contenido del archivo JSON.
+    :rtype: str
+    """
 
+    texto = io.StringIO()
+    exportacion.exportar_resultados(texto, datos_frecuencia, datos_chi2, datos_ks)
 
-            # Generación de muestras
-            serie = sim.generar_serie_exponencial_negativa(int(n), float(lam))
+    return texto.getvalue()
 
-            # Cálculo de parámetros
-            cant_muestras, media, varianza, desv_est = sim.calcular_parametros(serie)
 
-            # Generación de intervalos, frecuencias observadas y esperadas
-            lista_li, lista_ls, lista_marca, lista_fo = sim.generar_intervalos_dist_continua(serie, int(intervalos))
-            lista_fe = sim.calcular_frecuencia_esperada_exp_neg(lista_li, lista_ls, cant_muestras, media)
+@st.cache_data
+def obtener_tabla_inversa(expresion, a, b):
+    """
+    Construye la tabla de la transformada inversa de una función de distribución. La tabla se construye una única vez
+    por cada combinación de expresión y soporte.
+
+    :param expresion: Expresión de la función de distribución.
+    :type expresion: str
+    :param a: Límite inferior del soporte.
+    :type a: float
+    :param b: Límite superior del soporte.
+    :type b: float
+    :return: La tabla para sim.generar_serie_tabla_inversa.
+    :rtype: (list[float], list[float], list[int])
+    """
 
-        case "P":
+    return sim.construir_tabla_inversa(crear_fda(expresion), a, b)
 
-            # Generación de muestras
-            serie = sim.generar_serie_poisson(int(n), float(lam))
 
-            # Cálculo de parámetros
-            cant_muestras, media, varianza, desv_est = sim.calcular_parametros(serie)
 
-            # Generación de intervalos, frecuencias observadas y esperadas
-            lista_marca, lista_fo = sim.generar_intervalos_dist_discreta(serie)
-            lista_fe = sim.calcular_frecuencia_esperada_poisson(lista_marca, media, cant_muestras)
 
-        # Prueba de bondad de ajuste
+n = st.number_input("Tamaño de la muestra", value=10000, step=1)
+semilla = st.number_input("Semilla", value=0, step=1)
 
-    chi2_calculado, chi2_tabulado, nivel_de_confianza, grados_libertad = sim.calcular_chi2(lista_fo, lista_fe,
-                                                                                           distribucion[dc])
-    ks_calculado, ks_tabulado, nivel_de_confianza = sim.calcular_ks(lista_fo, lista_fe)
+# Almacén de series en disco
 
-    # Carga de datos en diccionarios
+st.sidebar.header("Almacén de series")
+ruta_serie = st.sidebar.text_input("Archivo de serie", value="serie.sim")
+guardar = st.sidebar.checkbox("Guardar la serie generada")
+reabrir = st.sidebar.checkbox("Reabrir la serie guardada en lugar de generarla")
 
-    if distribucion in ["U", "N", "EN"]:
-        datos_frecuencia = {
-            "#": range(intervalos),
-            "Desde": [round(i, 4) for i in lista_li],
-            "Hasta": [round(i, 4) for i in lista_ls],
-            "Marca de clase": [round(i, 4) for i in lista_marca],
-            "Frecuencia observada": lista_fo,
-            "Frecuencia esperada": [round(i, 0) for i in lista_fe]
-        }
-    else:
-        datos_frecuencia = {
-            "#": [i for i in range(len(lista_fo))],
-            "Marca de clase": lista_marca,
-            "Frecuencia observada": lista_fo,
-            "Frecuencia esperada": lista_fe
-        }
+# Exportación de resultados
+
+st.sidebar.header("Exportación")
+exportar = st.sidebar.checkbox("Preparar descarga de la serie y los resultados")
 
-    datos_chi2 = {
-        "Nivel de confianza": nivel_de_confianza,
-        "Grados de libertad": grados_libertad,
-        "χ2 calculado": round(chi2_calculado, 4),
-        "χ2 tabulado": round(chi2_tabulado, 4),
-    }
+# Historial de corridas
 
-    datos_ks = {
-        "Nivel de confianza": nivel_de_confianza,
-        "Cantidad de muestras": n,
-        "K-S calculado": round(ks_calculado, 4),
-        "K-S tabulado": round(ks_tabulado, 4)
-    }
+st.sidebar.header("Historial")
+usar_historial = st.sidebar.checkbox("Reutilizar resultados de corridas anteriores", value=True)
 
-    # Generación de visualizacion
+# Reducción de varianza
 
-    #alerta_chi2 = crear_alerta_chi2(grados_libertad, chi2_calculado, chi2_tabulado)
-    #alerta_ks = crear_alerta_ks(ks_calculado, ks_tabulado)
-    histograma = crear_histograma(lista_marca, lista_fo, lista_fe)
+st.sidebar.header("Reducción de varianza")
+codigo_fuente = fuentes_uniformes[st.sidebar.selectbox("Fuente de números uniformes", fuentes_uniformes)]
+comparar = st.sidebar.checkbox("Comparar la convergencia de las fuentes")
 
+if distribucion[dc] == "N":
+        media = st.number_input("Media", value=0.0, step=0.1)
+        desv = st.number_input("Desviación estándar", value=1.0, step=0.1)
 
-    st.header("Histograma")
-    st.plotly_chart(histograma)
+elif distribucion[dc] == "U":
+    li = st.number_input("Valor mínimo", value=0.0, step=0.1)
+    ls = st.number_input("Valor máximo", value=1.0, step=0.1)
 
-    st.header("Frecuencias Observadas y Esperadas")
+elif distribucion[dc] in ["EN", "P"]:
+    lam = st.number_input("Lambda", value=5.0, step=0.1, min_value=0.0)
+    if distribucion[dc] == "P":
+        usar_alias = st.checkbox("Generar con el método alias")
 
-    st.table(datos_frecuencia)
+elif distribucion[dc] == "B":
+    ensayos = st.number_input("Cantidad de ensayos", value=10, step=1, min_value=1)
+    prob_exito = st.number_input("Probabilidad de éxito", value=0.5, step=0.05, min_value=0.0, max_value=1.0)
 
-    st.header("Pruebas de Bondad de Ajuste")
-    st.subheader("Chi cuadrado")
-    st.table(datos_chi2)
+elif distribucion[dc] == "E":
+    archivo_muestra = st.file_uploader("Muestra de valores enteros (separados por espacios, comas o saltos de línea)")
 
-    # Se crea una alerta en base al resultado de la prueba
+elif distribucion[dc] == "FDA":
+    expresion = st.text_input("Función de distribución acumulada F(x)", value="1 - exp(-x / 2)")
+    a_fda = st.number_input("Límite inferior del soporte", value=0.0, step=0.1)
+    b_fda = st.number_input("Límite superior del soporte", value=30.0, step=0.1)
 
-    if grados_libertad <= 0:
-        st.warning(
-            "La cantidad de muestras no es suficiente para conseguir el χ2 tabulado ó se presentó un "
-            "error de cálculo")
-    elif chi2_calculado <= chi2_tabulado:
-        st.info("El test de χ2 no rechaza la hipótesis nula")
-    else:
-        st.error("El test de χ2 rechaza la hipótesis nula")
+if distribucion[dc] in ["N", "U", "EN", "FDA"] or reabrir:
+    modo = modos_intervalos[st.selectbox("Modo de intervalos", modos_intervalos)]
+    if modo != "FD":
+        intervalos = st.number_input("Cantidad de Intervalos", value=15, step=1)
+
+if st.button("Generar Histograma"):
+
+    # Configuración de la corrida
+
+    if reabrir:
+
+        # Apertura de la serie guardada, mapeada en memoria
+
+        try:
+            serie, metadatos = almacen.abrir_serie(ruta_serie)
+        except (OSError, ValueError) as error:
+            st.error(f"No se pudo abrir la serie guardada: {error}")
+            st.stop()
+
+        codigo = metadatos["distribucion"]
+        parametros = metadatos["parametros"]
+        semilla_corrida = metadatos["semilla"]
+        cantidad = metadatos["cantidad"]
 
-    st.subheader("KS")
-    st.table(datos_ks)
-    if ks_calculado <= ks_tabulado:
-        st.info(
-            "El test de K-S no rechaza la hipótesis nula")
     else:
-        st.warning(
-            "El test de K-S rechaza la hipótesis nula")
+
+        serie = None
+        codigo = distribucion[dc]
+        semilla_corrida = int(semilla)
+        cantidad = int(n)
+
+        match codigo:
+            case "U":
+                parametros = {"a": float(li), "b": float(ls)}
+            case "N":
+                parametros = {"media": float(media), "desviacion": float(desv)}
+            case "EN":
+                parametros = {"lam": float(lam)}
+            case "P":
+                parametros = {"lam": float(lam), "alias": True} if usar_alias else {"lam": float(lam)}
+            case "B":
+                parametros = {"ensayos": int(ensayos), "p": float(prob_exito)}
+            case "E":
+                if archivo_muestra is None:
+                    st.error("Se debe subir un archivo con la muestra")
+                    st.stop()
+                valores, probabilidades, _, _ = sim.tabla_alias_empirica(leer_muestra(archivo_muestra))
+                parametros = {"valores": list(valores), "probabilidades": list(probabilidades)}
+            case "FDA":
+                parametros = {"expresion": expresion, "a": float(a_fda), "b": float(b_fda)}
+
+                # La tabla se construye antes de generar para informar una expresión inválida o que no pueda
+                # evaluarse en el soporte
+
+                try:
+                    obtener_tabla_inversa(parametros["expresion"], parametros["a"], parametros["b"])
+                except (ArithmeticError, TypeError, ValueError) as error:
+                    st.error(f"La función de distribución no es válida: {error}")
+                    st.stop()
+
+        if codigo_fuente != "A":
+            parametros["fuente"] = codigo_fuente
+
+        # El método de rechazo compilado usa el generador de numba, por lo que la misma semilla produce otra serie que
+        # en Python puro. El backend se registra en los parámetros para distinguirlas en el historial y en la serie
+        # guardada.
+
+        if codigo == "P" and not parametros.get("alias") and "fuente" not in parametros and jit_disponible:
+            parametros["backend"] = "numba"
+
+    # La serie reabierta y la conexión al historial se cierran al terminar, aunque el análisis falle
+
+    conexion = None
+    try:
+
+        if codigo in ["U", "N", "EN", "FDA"]:
+            cant_intervalos = int(intervalos) if modo != "FD" else 0
+            clave_parametros = {**parametros, "modo_intervalos": modo}
+        else:
+            cant_intervalos = 0
+            clave_parametros = parametros
+
+        # Búsqueda en el historial de corridas
+
+        # Un resultado del historial evita generar la serie, por lo que no se busca cuando la serie hace falta para
+        # guardarla o exportarla. La corrida se registra igualmente en el historial.
+
+        resultados = None
+        if usar_historial:
+            conexion = historial.conectar()
+            if not (exportar or (guardar and not reabrir)):
+                resultados = historial.buscar_corrida(conexion, codigo, clave_parametros, semilla_corrida, cantidad,
+                                                      cant_intervalos)
+
+        if resultados is None:
+
+            # En los modos de intervalos adaptativos se construye un bosquejo de cuantiles, al que los generadores
+            # agregan cada elemento a medida que lo generan
+
+            adaptativo = codigo in ["U", "N", "EN", "FDA"] and modo != "F"
+            bosquejo = cuantiles.BosquejoCuantiles(semilla=semilla_corrida) if adaptativo else None
+
+            if serie is None:
+
+                # Generación de muestras
+
+                rd.seed(semilla_corrida)
+                fuente = uniformes.FUENTES.get(parametros.get("fuente"))
+
+                match codigo:
+                    case "U":
+                        serie = sim.generar_serie_uniforme(cantidad, parametros["a"], parametros["b"], bosquejo, fuente)
+                    case "N":
+                        serie = sim.generar_serie_normal(cantidad, parametros["media"], parametros["desviacion"],
+                                                         bosquejo, fuente)
+                    case "EN":
+                        serie = sim.generar_serie_exponencial_negativa(cantidad, parametros["lam"], bosquejo, fuente)
+                    case "P":
+
+                        # El método de rechazo consume una cantidad variable de números uniformes por muestra, por lo
+                        # que con una fuente alternativa se genera con el método alias
+
+                        if parametros.get("alias") or fuente is not None:
+                            tabla = sim.tabla_alias_poisson(parametros["lam"])
+                            serie = sim.generar_serie_alias(cantidad, tabla, fuente)
+                        else:
+                            serie = sim.generar_serie_poisson(cantidad, parametros["lam"])
+                    case "B":
+                        tabla = sim.tabla_alias_binomial(parametros["ensayos"], parametros["p"])
+                        serie = sim.generar_serie_alias(cantidad, tabla, fuente)
+                    case "E":
+                        tabla = sim.tabla_alias_discreta(tuple(parametros["valores"]),
+                                                         tuple(parametros["probabilidades"]))
+                        serie = sim.generar_serie_alias(cantidad, tabla, fuente)
+                    case "FDA":
+                        tabla = obtener_tabla_inversa(parametros["expresion"], parametros["a"], parametros["b"])
+                        serie = sim.generar_serie_tabla_inversa(cantidad, tabla, bosquejo, fuente)
+
+                if guardar:
+                    almacen.guardar_serie(ruta_serie, serie, codigo, parametros, semilla_corrida,
+                                          "q" if codigo in ["P", "B", "E"] else "d")
+
+            elif adaptativo:
+
+                # La serie reabierta se recorre una vez para construir el bosquejo
+
+                bosquejo.agregar_todos(serie)
+
+            # Cálculo de parámetros
+
+            cant_muestras, media, varianza, desv_est = sim.calcular_parametros(serie)
+
+            # Generación de intervalos y frecuencias observadas
+
+            if codigo in ["U", "N", "EN", "FDA"]:
+                if modo == "F":
+                    lista_li, lista_ls, lista_marca, lista_fo = sim.generar_intervalos_dist_continua(serie,
+                                                                                                     cant_intervalos)
+                else:
+                    if modo == "FD":
+                        lista_limites = sim.generar_limites_freedman_diaconis(bosquejo)
+                    else:
+                        lista_limites = sim.generar_limites_equiprobables(bosquejo, cant_intervalos)
+                    lista_li, lista_ls, lista_marca, lista_fo = sim.generar_intervalos_desde_limites(serie,
+                                                                                                     lista_limites)
+
+            match codigo:
+
+                case "U":
+
+                    # Generación de frecuencias esperadas
+                    if modo == "F":
+                        lista_fe = sim.calcular_frecuencia_esperada_uniforme(cant_muestras, cant_intervalos)
+                    else:
+                        lista_fe = sim.calcular_frecuencia_esperada_uniforme_limites(lista_li, lista_ls, cant_muestras)
+
+                case "N":
+
+                    # Generación de frecuencias esperadas
+                    if modo == "F":
+                        lista_fe = sim.calcular_frecuencia_esperada_normal(lista_li, lista_ls, lista_marca,
+                                                                           cant_muestras, media, desv_est)
+                    else:
+                        lista_fe = sim.calcular_frecuencia_esperada_normal_acumulada(lista_li, lista_ls, cant_muestras,
+                                                                                     media, desv_est)
+
+                case "EN":
+
+                    # Generación de frecuencias esperadas
+                    lista_fe = sim.calcular_frecuencia_esperada_exp_neg(lista_li, lista_ls, cant_muestras, media)
+
+                case "FDA":
+
+                    # Generación de frecuencias esperadas, con la función de distribución ingresada como hipótesis
+                    # nula
+                    lista_fe = sim.calcular_frecuencia_esperada_fda(lista_li, lista_ls, cant_muestras,
+                                                                    crear_fda(parametros["expresion"]),
+                                                                    parametros["a"], parametros["b"])
+
+                case "P":
+
+                    # Generación de intervalos, frecuencias observadas y esperadas
+                    lista_li = lista_ls = []
+                    lista_marca, lista_fo = sim.generar_intervalos_dist_discreta(serie)
+                    lista_fe = sim.calcular_frecuencia_esperada_poisson(lista_marca, media, cant_muestras)
+
+                case "B" | "E":
+
+                    # Generación de intervalos, frecuencias observadas y esperadas
+                    if codigo == "B":
+                        valores, probabilidades, _, _ = sim.tabla_alias_binomial(parametros["ensayos"], parametros["p"])
+                    else:
+                        valores, probabilidades = parametros["valores"], parametros["probabilidades"]
+                    lista_li = lista_ls = []
+                    lista_marca, lista_fo = sim.generar_intervalos_dist_discreta(serie)
+                    lista_fe = sim.calcular_frecuencia_esperada_discreta(lista_marca, valores, probabilidades,
+                                                                         cant_muestras)
+
+            # Prueba de bondad de ajuste
+
+            resultados = {
+                "parametros": [cant_muestras, media, varianza, desv_est],
+                "lista_li": lista_li,
+                "lista_ls": lista_ls,
+                "lista_marca": lista_marca,
+                "lista_fo": lista_fo,
+                "lista_fe": lista_fe,
+                "chi2": sim.calcular_chi2(lista_fo, lista_fe, codigo),
+                "ks": sim.calcular_ks(lista_fo, lista_fe),
+            }
+
+            if usar_historial:
+                historial.guardar_corrida(conexion, codigo, clave_parametros, semilla_corrida, cantidad,
+                                          cant_intervalos, resultados)
+
+        else:
+            st.caption("Resultados recuperados del historial de corridas, sin regenerar la serie.")
+
+        # Lectura de resultados
+
+        cant_muestras, media, varianza, desv_est = resultados["parametros"]
+        lista_li = resultados["lista_li"]
+        lista_ls = resultados["lista_ls"]
+        lista_marca = resultados["lista_marca"]
+        lista_fo = resultados["lista_fo"]
+        lista_fe = resultados["lista_fe"]
+        chi2_calculado, chi2_tabulado, nivel_de_confianza, grados_libertad = resultados["chi2"]
+        ks_calculado, ks_tabulado, nivel_de_confianza = resultados["ks"]
+
+        # Carga de datos en diccionarios
+
+        if codigo in ["U", "N", "EN", "FDA"]:
+            datos_frecuencia = {
+                "#": [i for i in range(len(lista_fo))],
+                "Desde": [round(i, 4) for i in lista_li],
+                "Hasta": [round(i, 4) for i in lista_ls],
+                "Marca de clase": [round(i, 4) for i in lista_marca],
+                "Frecuencia observada": lista_fo,
+                "Frecuencia esperada": [round(i, 0) for i in lista_fe]
+            }
+        else:
+            datos_frecuencia = {
+                "#": [i for i in range(len(lista_fo))],
+                "Marca de clase": lista_marca,
+                "Frecuencia observada": lista_fo,
+                "Frecuencia esperada": lista_fe
+            }
+
+        datos_chi2 = {
+            "Nivel de confianza": nivel_de_confianza,
+            "Grados de libertad": grados_libertad,
+            "χ2 calculado": round(chi2_calculado, 4),
+            "χ2 tabulado": round(chi2_tabulado, 4),
+        }
+
+        datos_ks = {
+            "Nivel de confianza": nivel_de_confianza,
+            "Cantidad de muestras": cant_muestras,
+            "K-S calculado": round(ks_calculado, 4),
+            "K-S tabulado": round(ks_tabulado, 4)
+        }
+
+        # Generación de visualizacion
+
+        #alerta_chi2 = crear_alerta_chi2(grados_libertad, chi2_calculado, chi2_tabulado)
+        #alerta_ks = crear_alerta_ks(ks_calculado, ks_tabulado)
+        histograma = crear_histograma(lista_marca, lista_fo, lista_fe)
+
+
+        st.header("Histograma")
+        st.plotly_chart(histograma)
+
+        st.header("Frecuencias Observadas y Esperadas")
+
+        st.table(datos_frecuencia)
+
+        st.header("Pruebas de Bondad de Ajuste")
+        st.subheader("Chi cuadrado")
+        st.table(datos_chi2)
+
+        # Se crea una alerta en base al resultado de la prueba
+
+        if grados_libertad <= 0:
+            st.warning(
+                "La cantidad de muestras no es suficiente para conseguir el χ2 tabulado ó se presentó un "
+                "error de cálculo")
+        elif chi2_calculado <= chi2_tabulado:
+            st.info("El test de χ2 no rechaza la hipótesis nula")
+        else:
+            st.error("El test de χ2 rechaza la hipótesis nula")
+
+        st.subheader("KS")
+        st.table(datos_ks)
+        if ks_calculado <= ks_tabulado:
+            st.info(
+                "El test de K-S no rechaza la hipótesis nula")
+        else:
+            st.warning(
+                "El test de K-S rechaza la hipótesis nula")
+
+        # Comparación de la convergencia de las fuentes de números uniformes, con los parámetros de la distribución como
+        # hipótesis nula y los intervalos de la corrida actual
+
+        if comparar and codigo in ["U", "N", "EN", "FDA"]:
+
+            match codigo:
+                case "U":
+                    a, b = sorted([parametros["a"], parametros["b"]])
+                    fda_nula = lambda x: min(max((x - a) / (b - a), 0), 1)
+                    generar = lambda m, fuente: sim.generar_serie_uniforme(m, a, b, fuente=fuente)
+                case "N":
+                    fda_nula = lambda x: (1 + math.erf((x - parametros["media"]) /
+                                                       (parametros["desviacion"] * math.sqrt(2)))) / 2
+                    generar = lambda m, fuente: sim.generar_serie_normal(m, parametros["media"],
+                                                                         parametros["desviacion"], fuente=fuente)
+                case "EN":
+                    fda_nula = lambda x: 1 - math.exp(-parametros["lam"] * max(x, 0))
+                    generar = lambda m, fuente: sim.generar_serie_exponencial_negativa(m, parametros["lam"],
+                                                                                       fuente=fuente)
+                case "FDA":
+                    a, b = sorted([parametros["a"], parametros["b"]])
+                    fda = crear_fda(parametros["expresion"])
+                    tabla = obtener_tabla_inversa(parametros["expresion"], a, b)
+                    fda_nula = lambda x: (fda(min(max(x, a), b)) - fda(a)) / (fda(b) - fda(a))
+                    generar = lambda m, fuente: sim.generar_serie_tabla_inversa(m, tabla, fuente=fuente)
+
+            tamanos = [10 ** i for i in range(2, 6) if 10 ** i <= max(cantidad, 100)]
+            fuentes = {nombre: uniformes.FUENTES[codigo_f] if codigo_f != "A" else None
+                       for nombre, codigo_f in fuentes_uniformes.items()}
+            errores = sim.comparar_convergencia(generar, fda_nula, lista_li + [lista_ls[-1]], tamanos, fuentes)
+
+            st.header("Convergencia de las fuentes de números uniformes")
+            st.plotly_chart(crear_grafico_convergencia(tamanos, errores))
+            st.table({"Tamaño de la muestra": tamanos,
+                      **{nombre: [round(e, 5) for e in lista] for nombre, lista in errores.items()}})
+
+        # Exportación de la serie y de los resultados. La serie se codifica por bloques a un archivo temporal propio de
+        # esta corrida, sin armar el contenido codificado en memoria. Los botones de descarga reciben funciones que
+        # producen los datos recién al hacer clic; en ese momento Streamlit lee el archivo completo en memoria para
+        # servirlo, por lo que la descarga en sí no se hace por bloques.
+
+        # El archivo temporal de la exportación anterior de esta sesión ya no se puede descargar, por lo que se elimina
+
+        ruta_anterior = st.session_state.pop("ruta_exportacion_serie", None)
+        if ruta_anterior is not None and os.path.exists(ruta_anterior):
+            os.remove(ruta_anterior)
+
+        if exportar:
+
+            st.header("Exportación")
+
+            # Si los resultados provienen del historial la serie no fue generada, por lo que solo se exportan los
+            # resultados
+
+            if serie is not None:
+                descriptor, ruta_exportacion_serie = tempfile.mkstemp(prefix="serie_", suffix=".zip")
+                st.session_state["ruta_exportacion_serie"] = ruta_exportacion_serie
+
+                with os.fdopen(descriptor, "wb") as archivo:
+                    exportacion.exportar_serie(archivo, serie, "q" if codigo in ["P", "B", "E"] else "d",
+                                               metadatos={"distribucion": codigo, "semilla": semilla_corrida})
+
+                st.download_button("Descargar serie", functools.partial(leer_archivo, ruta_exportacion_serie),
+                                   file_name="serie.zip", mime="application/zip", on_click="ignore")
+
+            st.download_button("Descargar frecuencias y pruebas",
+                               functools.partial(resultados_json, datos_frecuencia, datos_chi2, datos_ks),
+                               file_name="resultados.json", mime="application/json", on_click="ignore")
+
+    finally:
+        if reabrir:
+            serie.cerrar()
+        if conexion is not None:
+            conexion.close()
@@ -0,0 +1,203 @@
+import array
+import json
+import mmap
+import os
+import struct
+import sys
+
+
+# =====================================================================================================================
+#
+# ALMACÉN DE SERIES EN DISCO
+#
+# =====================================================================================================================
+
+# Estructura del archivo:
+#   - 8 bytes con el número mágico.
+#   - 8 bytes (uint64) con la cantidad de elementos de la serie.
+#   - 4 bytes (uint32) con la longitud del encabezado JSON.
+#   - Encabezado JSON con los metadatos, completado con espacios hasta un múltiplo de 8 bytes.
+#   - Los elementos de la serie en binario crudo, con el tipo y orden de bytes indicados en el encabezado.
+
+NUMERO_MAGICO = b"SIMSERIE"
+_PREFIJO = struct.Struct("<8sQI")
+TIPOS_VALIDOS = {"d": "float64", "q": "int64"}
+TAMANO_BLOQUE = 1 << 16
+
+
+def guardar_serie(ruta, muestras, distribucion, parametros, semilla, tipo="d") -> dict:
+    """
+    Guarda una serie en disco como binario crudo precedido por un encabezado de metadatos. La serie se recorre una
+    única vez y se escribe por bloques, por lo que puede ser cualquier iterable (incluso un generador).
+
+    :param ruta: Ruta del archivo a escribir.
+    :type ruta: str
+    :param muestras: Elementos de la serie.
+    :type muestras: Iterable[float] | Iterable[int]
+    :param distribucion: Código de la distribución que generó la serie ("U", "N", "EN", "P", "B", "E", "FDA").
+    :type distribucion: str
+    :param parametros: Parámetros con los que se generó la serie.
+    :type parametros: dict[str, float]
+    :param semilla: Semilla utilizada para generar la serie.
+    :type semilla: int
+    :param tipo: Código de tipo del módulo array: "d" para reales, "q" para enteros.
+    :type tipo: str
+    :return: Los metadatos escritos en el encabezado.
+    :rtype: dict
+    """
+
+    if tipo not in TIPOS_VALIDOS:
+        raise ValueError(f"Tipo de dato no soportado: {tipo}")
+
+    metadatos = {
+        "distribucion": distribucion,
+        "parametros": parametros,
+        "semilla": semilla,
+        "tipo": tipo,
+        "dtype": TIPOS_VALIDOS[tipo],
+        "orden_bytes": sys.byteorder,
+    }
+
+    encabezado = json.dumps(metadatos, ensure_ascii=False).encode("utf-8")
+    inicio_datos = _PREFIJO.size + len(encabezado)
+    encabezado += b" " * (-inicio_datos % 8)
+
+    cantidad = 0
+    with open(ruta, "wb") as archivo:
+
+        # La cantidad se desconoce hasta terminar de recorrer la serie, por lo que se escribe al final
+
+        archivo.write(_PREFIJO.pack(NUMERO_MAGICO, 0, len(encabezado)))
+        archivo.write(encabezado)
+
+        bloque = array.array(tipo)
+        for x in muestras:
+            bloque.append(x)
+            if len(bloque) == TAMANO_BLOQUE:
+                bloque.tofile(archivo)
+                cantidad += len(bloque)
+                bloque = array.array(tipo)
+        bloque.tofile(archivo)
+        cantidad += len(bloque)
+
+        archivo.seek(0)
+        archivo.write(_PREFIJO.pack(NUMERO_MAGICO, cantidad, len(encabezado)))
+
+    metadatos["cantidad"] = cantidad
+
+    return metadatos
+
+
+def leer_metadatos(ruta) -> dict:
+    """
+    Lee el encabezado de un archivo de serie sin abrir los datos.
+
+    :param ruta: Ruta del archivo de serie.
+    :type ruta: str
+    :return: Los metadatos de la serie, incluyendo la cantidad de elementos.
+    :rtype: dict
+    """
+
+    with open(ruta, "rb") as archivo:
+        metadatos, _ = _leer_encabezado(archivo)
+
+    return metadatos
+
+
+def abrir_serie(ruta) -> ("SerieMapeada", dict):
+    """
+    Abre una serie guardada en disco mapeándola en memoria, sin cargar sus elementos.
+
+    :param ruta: Ruta del archivo de serie.
+    :type ruta: str
+    :return: La serie mapeada y sus metadatos.
+    :rtype: (SerieMapeada, dict)
+    """
+
+    serie = SerieMapeada(ruta)
+
+    return serie, serie.metadatos
+
+
+def _leer_encabezado(archivo) -> (dict, int):
+
+    # Los archivos truncados o con un encabezado ilegible se informan como ValueError
+
+    prefijo = archivo.read(_PREFIJO.size)
+    if len(prefijo) < _PREFIJO.size:
+        raise ValueError("El archivo no corresponde a una serie guardada")
+
+    magico, cantidad, long_encabezado = _PREFIJO.unpack(prefijo)
+    if magico != NUMERO_MAGICO:
+        raise ValueError("El archivo no corresponde a una serie guardada")
+
+    try:
+        metadatos = json.loads(archivo.read(long_encabezado).decode("utf-8"))
+        if not {"distribucion", "parametros", "semilla", "tipo", "orden_bytes"} <= metadatos.keys():
+            raise ValueError
+    except (ValueError, AttributeError):
+        raise ValueError("El encabezado de la serie guardada está dañado") from None
+    metadatos["cantidad"] = cantidad
+
+    if metadatos["tipo"] not in TIPOS_VALIDOS:
+        raise ValueError(f"Tipo de dato no soportado: {metadatos['tipo']}")
+    if metadatos["orden_bytes"] != sys.byteorder:
+        raise ValueError("La serie fue guardada con un orden de bytes distinto al de este equipo")
+
+    return metadatos, _PREFIJO.size + long_encabezado
+
+
+class SerieMapeada:
+    """
+    Serie de solo lectura respaldada por un archivo mapeado en memoria. Se comporta como una lista para las funciones
+    de cálculo de simulacion.py (len, índices, iteración, sum, min, max y count), recorriendo el archivo sin cargarlo.
+    """
+
+    def __init__(self, ruta):
+
+        self._archivo = open(ruta, "rb")
+        try:
+            self.metadatos, inicio_datos = _leer_encabezado(self._archivo)
+            self._tipo = self.metadatos["tipo"]
+            self._cantidad = self.metadatos["cantidad"]
+            fin_datos = inicio_datos + self._cantidad * array.array(self._tipo).itemsize
+            if os.fstat(self._archivo.fileno()).st_size < fin_datos:
+                raise ValueError("La serie guardada está incompleta")
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._archivo.close()
+            raise
+
+        self._vista = memoryview(self._mapa)[inicio_datos:fin_datos].cast(self._tipo)
+
+    def __len__(self):
+        return self._cantidad
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return self._vista[indice].tolist()
+        return self._vista[indice]
+
+    def __iter__(self):
+
+        # Se itera por bloques para no crear un objeto por cada acceso a la vista
+
+        for inicio in range(0, self._cantidad, TAMANO_BLOQUE):
+            yield from self._vista[inicio:inicio + TAMANO_BLOQUE].tolist()
+
+    def count(self, valor) -> int:
+        contador = 0
+        for inicio in range(0, self._cantidad, TAMANO_BLOQUE):
+            contador += self._vista[inicio:inicio + TAMANO_BLOQUE].tolist().count(valor)
+        return contador
+
+    def cerrar(self):
+        self._vista.release()
+        self._mapa.close()
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.cerrar()
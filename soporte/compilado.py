@@ -0,0 +1,167 @@
+import os
+
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+
+
+# =====================================================================================================================
+#
+# BACKEND COMPILADO
+#
+# =====================================================================================================================
+
+# Versiones compiladas con numba de los ciclos escalares de simulacion.py: el método de rechazo de Poisson, el
+# agrupamiento de frecuencias de calcular_chi2 y el recorrido acumulado de calcular_ks. Si numba no está instalado,
+# si la variable de entorno SIM_JIT vale 0, o si la verificación inicial falla, simulacion.py usa sus versiones en
+# Python puro. La compilación se guarda en disco (cache=True), por lo que solo se paga en la primera ejecución.
+
+HABILITADO = os.environ.get("SIM_JIT", "1").strip().lower() not in ("0", "false", "no")
+DISPONIBLE = False
+ESTADO = "sin verificar"
+
+if HABILITADO and numba is not None:
+
+    @numba.njit(cache=True)
+    def _poisson_rechazo(n, lam, semilla):
+        np.random.seed(semilla)
+        serie = np.empty(n, np.int64)
+        a = np.exp(-lam)
+        for i in range(n):
+            p = 1.0
+            x = -1
+            while p >= a:
+                p *= np.random.random()
+                x += 1
+            serie[i] = x
+        return serie
+
+    @numba.njit(cache=True)
+    def _agrupar_frecuencias(frec_observada, frec_esperada):
+        nuevo_fo = np.zeros(max(len(frec_esperada), 1))
+        nuevo_fe = np.zeros(max(len(frec_esperada), 1))
+        k = 0
+        acum_fe = 0.0
+        acum_fo = 0.0
+        for i in range(len(frec_esperada)):
+            acum_fe += frec_esperada[i]
+            acum_fo += frec_observada[i]
+            if acum_fe >= 5:
+                nuevo_fe[k] = acum_fe
+                nuevo_fo[k] = acum_fo
+                k += 1
+                acum_fe = 0.0
+                acum_fo = 0.0
+        if k == 0:
+            nuevo_fe[0] = acum_fe
+            nuevo_fo[0] = acum_fo
+            k = 1
+        elif acum_fo > 0 or acum_fe > 0:
+            nuevo_fe[k - 1] += acum_fe
+            nuevo_fo[k - 1] += acum_fo
+        return nuevo_fo[:k], nuevo_fe[:k]
+
+    @numba.njit(cache=True)
+    def _ks_calculado(frec_observada, frec_esperada, cant_muestras):
+        ks_calculado = 0.0
+        po_acum = 0.0
+        pe_acum = 0.0
+        for i in range(len(frec_observada)):
+            po_acum += frec_observada[i] / cant_muestras
+            pe_acum += frec_esperada[i] / cant_muestras
+            dif = abs(po_acum - pe_acum)
+            if dif > ks_calculado:
+                ks_calculado = dif
+        return ks_calculado
+
+
+def verificar_backend() -> (bool, str):
+    """
+    Verifica, una única vez por proceso, que el backend compilado pueda usarse: compila (o carga desde la caché en
+    disco) cada función y compara su resultado con el esperado en un caso pequeño.
+
+    :return: Si el backend compilado está disponible y una descripción de su estado.
+    :rtype: (bool, str)
+    """
+
+    global DISPONIBLE, ESTADO
+
+    if ESTADO != "sin verificar":
+        return DISPONIBLE, ESTADO
+
+    if not HABILITADO:
+        ESTADO = "deshabilitado (SIM_JIT=0)"
+    elif numba is None:
+        ESTADO = "no disponible (numba no está instalado)"
+    else:
+        try:
+            serie = _poisson_rechazo(1000, 4.0, 1)
+            nuevo_fo, nuevo_fe = _agrupar_frecuencias(np.array([1.0, 2.0, 3.0]), np.array([3.0, 3.0, 1.0]))
+            ks_calculado = _ks_calculado(np.array([2.0, 0.0]), np.array([1.0, 1.0]), 2.0)
+
+            if serie.min() < 0 or list(nuevo_fo) != [6.0] or list(nuevo_fe) != [7.0] \
+                    or ks_calculado != 0.5:
+                raise ValueError("resultados inesperados")
+
+            DISPONIBLE = True
+            ESTADO = f"activo (numba {numba.__version__})"
+        except Exception as error:
+            ESTADO = f"no disponible ({error})"
+
+    return DISPONIBLE, ESTADO
+
+
+def generar_serie_poisson(n, lam, semilla) -> list[int]:
+    """
+    Versión compilada de simulacion.generar_serie_poisson. Usa el generador de números aleatorios de numba,
+    inicializado con la semilla indicada.
+
+    :param n: Cantidad de elementos a generar en la serie.
+    :type n: int
+    :param lam: El valor Lambda de la distribución.
+    :type lam: float
+    :param semilla: Semilla del generador de numba.
+    :type semilla: int
+    :return: Una serie de n números aleatorios con distribución de Poisson.
+    :rtype: list[int]
+    """
+
+    return _poisson_rechazo(n, lam, semilla).tolist()
+
+
+def agrupar_frecuencias(lista_frec_observada, lista_frec_esperada) -> (list[float], list[float]):
+    """
+    Versión compilada del agrupamiento de frecuencias de simulacion.calcular_chi2.
+
+    :param lista_frec_observada: Frecuencias observadas.
+    :type lista_frec_observada: list[int]
+    :param lista_frec_esperada: Frecuencias esperadas.
+    :type lista_frec_esperada: list[float]
+    :return: Las frecuencias observadas y esperadas agrupadas.
+    :rtype: (list[float], list[float])
+    """
+
+    nuevo_fo, nuevo_fe = _agrupar_frecuencias(np.asarray(lista_frec_observada, dtype=np.float64),
+                                              np.asarray(lista_frec_esperada, dtype=np.float64))
+
+    return nuevo_fo.tolist(), nuevo_fe.tolist()
+
+
+def calcular_ks_calculado(lista_frec_observada, lista_frec_esperada, cant_muestras) -> float:
+    """
+    Versión compilada del recorrido acumulado de simulacion.calcular_ks.
+
+    :param lista_frec_observada: Frecuencias observadas.
+    :type lista_frec_observada: list[int]
+    :param lista_frec_esperada: Frecuencias esperadas.
+    :type lista_frec_esperada: list[float]
+    :param cant_muestras: Cantidad de muestras.
+    :type cant_muestras: int
+    :return: El estadístico K-S calculado.
+    :rtype: float
+    """
+
+    return _ks_calculado(np.asarray(lista_frec_observada, dtype=np.float64),
+                         np.asarray(lista_frec_esperada, dtype=np.float64), float(cant_muestras))
@@ -0,0 +1,158 @@
+import math
+import random
+
+
+# =====================================================================================================================
+#
+# BOSQUEJO DE CUANTILES
+#
+# =====================================================================================================================
+
+class BosquejoCuantiles:
+    """
+    Bosquejo de cuantiles de tipo KLL. Resume una serie en una sola pasada con memoria acotada (del orden de k
+    elementos) y permite estimar cualquier cuantil con un error de rango aproximado de 1.7 / k. Dos bosquejos pueden
+    fusionarse, por lo que la serie puede procesarse por partes.
+
+    El mínimo, el máximo y la cantidad de elementos se registran de forma exacta.
+    """
+
+    def __init__(self, k=200, semilla=None):
+
+        self.k = k
+        self.n = 0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+
+        # Cada compactor guarda elementos con peso 2 ** nivel. Se usa un generador propio para no alterar la secuencia
+        # del módulo random, que es la que producen los generadores de series.
+
+        self._compactores = [[]]
+        self._aleatorio = random.Random(semilla)
+        self._tamano = 0
+        self._tamano_maximo = self._capacidad(0)
+
+    def _capacidad(self, nivel) -> int:
+        altura = len(self._compactores)
+        return max(2, int(math.ceil(self.k * (2 / 3) ** (altura - nivel - 1))))
+
+    def agregar(self, x):
+        """
+        Agrega un elemento al bosquejo.
+
+        :param x: El elemento a agregar.
+        :type x: float
+        """
+
+        self.n += 1
+        if x < self.minimo:
+            self.minimo = x
+        if x > self.maximo:
+            self.maximo = x
+
+        self._compactores[0].append(x)
+        self._tamano += 1
+        if self._tamano >= self._tamano_maximo:
+            self._compactar()
+
+    def agregar_todos(self, muestras):
+        """
+        Agrega todos los elementos de una serie al bosquejo.
+
+        :param muestras: Los elementos a agregar.
+        :type muestras: Iterable[float]
+        """
+
+        for x in muestras:
+            self.agregar(x)
+
+    def fusionar(self, otro):
+        """
+        Incorpora a este bosquejo los elementos resumidos por otro.
+
+        :param otro: El bosquejo a incorporar.
+        :type otro: BosquejoCuantiles
+        """
+
+        while len(self._compactores) < len(otro._compactores):
+            self._compactores.append([])
+        for nivel, compactor in enumerate(otro._compactores):
+            self._compactores[nivel].extend(compactor)
+
+        self.n += otro.n
+        self.minimo = min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+
+        self._tamano = sum(len(compactor) for compactor in self._compactores)
+        self._actualizar_tamano_maximo()
+        while self._tamano >= self._tamano_maximo:
+            self._compactar()
+
+    def _actualizar_tamano_maximo(self):
+        self._tamano_maximo = sum(self._capacidad(nivel) for nivel in range(len(self._compactores)))
+
+    def _compactar(self):
+
+        # Se compacta el primer nivel que excede su capacidad: se ordena y se conserva uno de cada dos elementos, que
+        # pasan al nivel siguiente con el doble de peso.
+
+        for nivel, compactor in enumerate(self._compactores):
+            if len(compactor) >= self._capacidad(nivel):
+
+                if nivel + 1 == len(self._compactores):
+                    self._compactores.append([])
+                    self._actualizar_tamano_maximo()
+
+                compactor.sort()
+                sobrante = [compactor.pop()] if len(compactor) % 2 else []
+                desplazamiento = self._aleatorio.randint(0, 1)
+
+                self._compactores[nivel + 1].extend(compactor[desplazamiento::2])
+                self._tamano -= len(compactor) // 2
+                self._compactores[nivel] = sobrante
+                break
+
+    def cuantiles(self, lista_q) -> list[float]:
+        """
+        Estima varios cuantiles de la serie resumida.
+
+        :param lista_q: Las probabilidades de los cuantiles a estimar, entre 0 y 1.
+        :type lista_q: list[float]
+        :return: Los cuantiles estimados, en el mismo orden que lista_q.
+        :rtype: list[float]
+        """
+
+        if self.n == 0:
+            raise ValueError("El bosquejo no contiene elementos")
+
+        elementos = sorted((x, 2 ** nivel) for nivel, compactor in enumerate(self._compactores) for x in compactor)
+        peso_total = sum(peso for _, peso in elementos)
+
+        resultado = []
+        for q in lista_q:
+            if q <= 0:
+                resultado.append(self.minimo)
+            elif q >= 1:
+                resultado.append(self.maximo)
+            else:
+                objetivo = q * peso_total
+                acumulado = 0
+                for x, peso in elementos:
+                    acumulado += peso
+                    if acumulado >= objetivo:
+                        break
+                resultado.append(x)
+
+        return resultado
+
+    def cuantil(self, q) -> float:
+        """
+        Estima un cuantil de la serie resumida.
+
+        :param q: La probabilidad del cuantil a estimar, entre 0 y 1.
+        :type q: float
+        :return: El cuantil estimado.
+        :rtype: float
+        """
+
+        return self.cuantiles([q])[0]
@@ -0,0 +1,124 @@
+import array
+import json
+import sys
+import zipfile
+
+
+# =====================================================================================================================
+#
+# EXPORTACIÓN DE SERIES Y RESULTADOS
+#
+# =====================================================================================================================
+
+# La serie se exporta como un archivo zip columnar: cada columna es un miembro comprimido con los valores en binario
+# crudo (little-endian) y un miembro "esquema.json" describe las columnas. Los resultados (frecuencias y pruebas de
+# bondad de ajuste) se exportan aparte en un archivo JSON compañero, ya que su tamaño es despreciable.
+
+TAMANO_BLOQUE = 1 << 16
+
+
+def exportar_serie(destino, muestras, tipo="d", nombre_columna="serie", metadatos=None) -> int:
+    """
+    Exporta una serie a un archivo zip columnar comprimido. La serie se recorre una única vez y se codifica por
+    bloques, de forma que ni la serie ni el archivo codificado se mantienen completos en memoria.
+
+    :param destino: Ruta o archivo binario abierto donde escribir la exportación.
+    :type destino: str | BinaryIO
+    :param muestras: Elementos de la serie.
+    :type muestras: Iterable[float] | Iterable[int]
+    :param tipo: Código de tipo del módulo array: "d" para reales, "q" para enteros.
+    :type tipo: str
+    :param nombre_columna: Nombre de la columna dentro del archivo.
+    :type nombre_columna: str
+    :param metadatos: Metadatos adicionales a incluir en el esquema.
+    :type metadatos: dict | None
+    :return: La cantidad de elementos exportados.
+    :rtype: int
+    """
+
+    if tipo not in ("d", "q"):
+        raise ValueError(f"Tipo de dato no soportado: {tipo}")
+
+    cantidad = 0
+    with zipfile.ZipFile(destino, "w", compression=zipfile.ZIP_DEFLATED) as archivo_zip:
+
+        # Escritura de la columna por bloques
+
+        with archivo_zip.open(f"{nombre_columna}.bin", "w", force_zip64=True) as columna:
+            bloque = array.array(tipo)
+            for x in muestras:
+                bloque.append(x)
+                if len(bloque) == TAMANO_BLOQUE:
+                    cantidad += _escribir_bloque(columna, bloque)
+                    bloque = array.array(tipo)
+            cantidad += _escribir_bloque(columna, bloque)
+
+        # Escritura del esquema
+
+        esquema = {
+            "cantidad": cantidad,
+            "columnas": [{"nombre": nombre_columna, "archivo": f"{nombre_columna}.bin",
+                          "dtype": "float64" if tipo == "d" else "int64", "orden_bytes": "little"}],
+            "metadatos": metadatos or {},
+        }
+        archivo_zip.writestr("esquema.json", json.dumps(esquema, ensure_ascii=False, indent=2))
+
+    return cantidad
+
+
+def _escribir_bloque(columna, bloque) -> int:
+
+    if sys.byteorder != "little":
+        bloque.byteswap()
+    columna.write(bloque.tobytes())
+
+    return len(bloque)
+
+
+def leer_serie_exportada(origen) -> (list, dict):
+    """
+    Lee una serie exportada con exportar_serie. Pensado para verificar exportaciones pequeñas.
+
+    :param origen: Ruta o archivo binario abierto con la exportación.
+    :type origen: str | BinaryIO
+    :return: Los elementos de la serie y el esquema del archivo.
+    :rtype: (list[float] | list[int], dict)
+    """
+
+    with zipfile.ZipFile(origen) as archivo_zip:
+        esquema = json.loads(archivo_zip.read("esquema.json"))
+        columna = esquema["columnas"][0]
+        valores = array.array("d" if columna["dtype"] == "float64" else "q")
+        valores.frombytes(archivo_zip.read(columna["archivo"]))
+
+    if sys.byteorder != "little":
+        valores.byteswap()
+
+    return valores.tolist(), esquema
+
+
+def exportar_resultados(destino, datos_frecuencia, datos_chi2, datos_ks) -> None:
+    """
+    Exporta las frecuencias y los resultados de las pruebas de bondad de ajuste a un archivo JSON.
+
+    :param destino: Ruta o archivo de texto abierto donde escribir el JSON.
+    :type destino: str | TextIO
+    :param datos_frecuencia: Diccionario con los datos de frecuencias.
+    :type datos_frecuencia: dict[str, list[float]]
+    :param datos_chi2: Diccionario con los datos de la prueba de chi2.
+    :type datos_chi2: dict[str, float]
+    :param datos_ks: Diccionario con los datos de la prueba de ks.
+    :type datos_ks: dict[str, float]
+    """
+
+    resultados = {
+        "frecuencias": {clave: list(valores) for clave, valores in datos_frecuencia.items()},
+        "chi2": datos_chi2,
+        "ks": datos_ks,
+    }
+
+    if isinstance(destino, str):
+        with open(destino, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, ensure_ascii=False, indent=2, default=float)
+    else:
+        json.dump(resultados, destino, ensure_ascii=False, indent=2, default=float)
@@ -0,0 +1,157 @@
+import json
+import sqlite3
+import time
+
+
+# =====================================================================================================================
+#
+# HISTORIAL DE CORRIDAS
+#
+# =====================================================================================================================
+
+# Cada corrida se guarda con sus resultados compactos (parámetros calculados, intervalos, frecuencias y pruebas de
+# bondad de ajuste), indexada por distribución, parámetros, semilla, tamaño de muestra y cantidad de intervalos. Las
+# series no se guardan, por lo que cada registro ocupa a lo sumo unos pocos kilobytes.
+
+RUTA_HISTORIAL = "historial.sqlite3"
+TAMANO_MAXIMO = 50 * 1024 * 1024
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS corridas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    distribucion TEXT NOT NULL,
+    parametros TEXT NOT NULL,
+    semilla INTEGER NOT NULL,
+    cantidad INTEGER NOT NULL,
+    intervalos INTEGER NOT NULL,
+    resultados TEXT NOT NULL,
+    tamano INTEGER NOT NULL,
+    ultimo_acceso REAL NOT NULL,
+    UNIQUE (distribucion, parametros, semilla, cantidad, intervalos)
+);
+CREATE INDEX IF NOT EXISTS idx_corridas_acceso ON corridas (ultimo_acceso);
+"""
+
+
+def conectar(ruta=RUTA_HISTORIAL) -> sqlite3.Connection:
+    """
+    Abre la base de datos del historial, creando las tablas si no existen.
+
+    :param ruta: Ruta del archivo de la base de datos.
+    :type ruta: str
+    :return: La conexión a la base de datos.
+    :rtype: sqlite3.Connection
+    """
+
+    conexion = sqlite3.connect(ruta)
+    conexion.executescript(_ESQUEMA)
+
+    return conexion
+
+
+def _clave(distribucion, parametros, semilla, cantidad, intervalos) -> tuple:
+
+    # Los parámetros se serializan con claves ordenadas para que la misma configuración produzca siempre la misma clave
+
+    return distribucion, json.dumps(parametros, sort_keys=True), int(semilla), int(cantidad), int(intervalos)
+
+
+def buscar_corrida(conexion, distribucion, parametros, semilla, cantidad, intervalos) -> dict | None:
+    """
+    Busca los resultados de una corrida previa con la misma configuración.
+
+    :param conexion: Conexión al historial.
+    :type conexion: sqlite3.Connection
+    :param distribucion: Código de la distribución.
+    :type distribucion: str
+    :param parametros: Parámetros de la distribución.
+    :type parametros: dict[str, float]
+    :param semilla: Semilla utilizada.
+    :type semilla: int
+    :param cantidad: Tamaño de la muestra.
+    :type cantidad: int
+    :param intervalos: Cantidad de intervalos (0 para distribuciones discretas).
+    :type intervalos: int
+    :return: Los resultados guardados, o None si la configuración no está en el historial.
+    :rtype: dict | None
+    """
+
+    clave = _clave(distribucion, parametros, semilla, cantidad, intervalos)
+
+    fila = conexion.execute(
+        "SELECT id, resultados FROM corridas "
+        "WHERE distribucion = ? AND parametros = ? AND semilla = ? AND cantidad = ? AND intervalos = ?",
+        clave).fetchone()
+
+    if fila is None:
+        return None
+
+    with conexion:
+        conexion.execute("UPDATE corridas SET ultimo_acceso = ? WHERE id = ?", (time.time(), fila[0]))
+
+    return json.loads(fila[1])
+
+
+def guardar_corrida(conexion, distribucion, parametros, semilla, cantidad, intervalos, resultados,
+                    tamano_maximo=TAMANO_MAXIMO) -> None:
+    """
+    Guarda los resultados de una corrida, reemplazando los de una corrida previa con la misma configuración, y poda el
+    historial para que no supere el tamaño máximo.
+
+    :param conexion: Conexión al historial.
+    :type conexion: sqlite3.Connection
+    :param distribucion: Código de la distribución.
+    :type distribucion: str
+    :param parametros: Parámetros de la distribución.
+    :type parametros: dict[str, float]
+    :param semilla: Semilla utilizada.
+    :type semilla: int
+    :param cantidad: Tamaño de la muestra.
+    :type cantidad: int
+    :param intervalos: Cantidad de intervalos (0 para distribuciones discretas).
+    :type intervalos: int
+    :param resultados: Resultados compactos de la corrida.
+    :type resultados: dict
+    :param tamano_maximo: Tamaño máximo del historial en bytes.
+    :type tamano_maximo: int
+    """
+
+    texto = json.dumps(resultados, default=float)
+
+    with conexion:
+        conexion.execute(
+            "INSERT OR REPLACE INTO corridas "
+            "(distribucion, parametros, semilla, cantidad, intervalos, resultados, tamano, ultimo_acceso) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            _clave(distribucion, parametros, semilla, cantidad, intervalos) + (texto, len(texto), time.time()))
+
+    podar_historial(conexion, tamano_maximo)
+
+
+def podar_historial(conexion, tamano_maximo=TAMANO_MAXIMO) -> int:
+    """
+    Elimina las corridas accedidas hace más tiempo hasta que el tamaño total de los resultados no supere el máximo.
+
+    :param conexion: Conexión al historial.
+    :type conexion: sqlite3.Connection
+    :param tamano_maximo: Tamaño máximo del historial en bytes.
+    :type tamano_maximo: int
+    :return: La cantidad de corridas eliminadas.
+    :rtype: int
+    """
+
+    total = conexion.execute("SELECT COALESCE(SUM(tamano), 0) FROM corridas").fetchone()[0]
+    if total <= tamano_maximo:
+        return 0
+
+    eliminar = []
+    for id_corrida, tamano in conexion.execute("SELECT id, tamano FROM corridas ORDER BY ultimo_acceso"):
+        if total <= tamano_maximo:
+            break
+        eliminar.append((id_corrida,))
+        total -= tamano
+
+    with conexion:
+        conexion.executemany("DELETE FROM corridas WHERE id = ?", eliminar)
+
+    return len(eliminar)
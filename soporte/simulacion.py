@@ -1,5 +1,8 @@
+import bisect
+import functools
 import math
 import random as rd
+import soporte.compilado as compilado
 from scipy.stats import kstwo, chi2
 
 
@@ -9,7 +12,17 @@ from scipy.stats import kstwo, chi2
 #
 # =====================================================================================================================
 
-def generar_serie_uniforme(n, a, b) -> list[float]:
+def _obtener_aleatorios(n, dimensiones, fuente) -> list:
+
+    # Devuelve, por cada dimensión, una función que entrega el siguiente número uniforme de la fuente
+
+    if fuente is None:
+        return [rd.random] * dimensiones
+
+    return [iter(columna).__next__ for columna in fuente(n, dimensiones)]
+
+
+def generar_serie_uniforme(n, a, b, bosquejo=None, fuente=None) -> list[float]:
     """
     Genera una serie de n números aleatorios manteniendo una distribución uniforme.
 
@@ -19,6 +32,10 @@ def generar_serie_uniforme(n, a, b) -> list[float]:
     :type a: float
     :param b: Límite superior de la distribución.
     :type b: float
+    :param bosquejo: Bosquejo de cuantiles al que se agregan los elementos generados.
+    :type bosquejo: BosquejoCuantiles | None
+    :param fuente: Fuente de números uniformes (ver uniformes.py). Por defecto se usa rd.random().
+    :type fuente: Callable[[int, int], list[list[float]]] | None
     :return: Una serie de n números con distribución uniforme.
     :rtype: list[float]
     """
@@ -26,14 +43,19 @@ def generar_serie_uniforme(n, a, b) -> list[float]:
     if a > b:
         a, b = b, a
 
+    aleatorio, = _obtener_aleatorios(n, 1, fuente)
+
     muestras = []
     for i in range(n):
-        muestras.append(rd.random() * (b - a) + a)
+        x = aleatorio() * (b - a) + a
+        muestras.append(x)
+        if bosquejo is not None:
+            bosquejo.agregar(x)
 
     return muestras
 
 
-def generar_serie_normal(n, media, desviacion) -> list[float]:
+def generar_serie_normal(n, media, desviacion, bosquejo=None, fuente=None) -> list[float]:
     """
     Genera una serie de n números aleatorios manteniendo una distribución normal.
 
@@ -43,21 +65,31 @@ def generar_serie_normal(n, media, desviacion) -> list[float]:
     :type desviacion: float
     :param media: La media de la distribución.
     :type media: float
+    :param bosquejo: Bosquejo de cuantiles al que se agregan los elementos generados.
+    :type bosquejo: BosquejoCuantiles | None
+    :param fuente: Fuente de números uniformes (ver uniformes.py). Por defecto se usa rd.random().
+    :type fuente: Callable[[int, int], list[list[float]]] | None
     :return: Una serie de n números aleatorios con distribución normal.
     :rtype: list[float]
     """
+    aleatorio_1, aleatorio_2 = _obtener_aleatorios(n, 2, fuente)
+
     numeros_aleatorios = []
     for i in range(n):
-        r1 = rd.random()
-        r2 = rd.random()
+        r1 = aleatorio_1()
+        r2 = aleatorio_2()
         while r1 == 0:
             r1 = rd.random()
         z = math.sqrt(-2.0 * math.log(r1)) * math.cos(2 * math.pi * r2)
-        numeros_aleatorios.append(media + desviacion * z)
+        x = media + desviacion * z
+        numeros_aleatorios.append(x)
+        if bosquejo is not None:
+            bosquejo.agregar(x)
+
     return numeros_aleatorios
 
 
-def generar_serie_exponencial_negativa(n, lam) -> list[float]:
+def generar_serie_exponencial_negativa(n, lam, bosquejo=None, fuente=None) -> list[float]:
     """
     Genera una serie de n números aleatorios manteniendo una distribución exponencial negativa.
 
@@ -65,13 +97,22 @@ def generar_serie_exponencial_negativa(n, lam) -> list[float]:
     :type n: int
     :param lam: El valor Lambda de la distribución.
     :type lam: float
+    :param bosquejo: Bosquejo de cuantiles al que se agregan los elementos generados.
+    :type bosquejo: BosquejoCuantiles | None
+    :param fuente: Fuente de números uniformes (ver uniformes.py). Por defecto se usa rd.random().
+    :type fuente: Callable[[int, int], list[list[float]]] | None
     :return: Una serie de n números aleatorios con distribución exponencial negativa.
     :rtype: list[float]
     """
 
+    aleatorio, = _obtener_aleatorios(n, 1, fuente)
+
     muestras = []
     for i in range(n):
-        muestras.append(-(1 / lam) * math.log(1 - rd.random()))
+        x = -(1 / lam) * math.log(1 - aleatorio())
+        muestras.append(x)
+        if bosquejo is not None:
+            bosquejo.agregar(x)
 
     return muestras
 
@@ -88,6 +129,9 @@ def generar_serie_poisson(n, lam) -> list[int]:
     :rtype: list[int]
     """
 
+    if compilado.DISPONIBLE:
+        return compilado.generar_serie_poisson(n, lam, rd.getrandbits(32))
+
     serie = []
     for i in range(n):
         p = 1
@@ -101,6 +145,249 @@ def generar_serie_poisson(n, lam) -> list[int]:
     return serie
 
 
+def construir_tabla_inversa(fda, a, b, tamano=16384) -> (list[float], list[float], list[int]):
+    """
+    Construye una tabla para muestrear por transformada inversa una función de distribución acumulada, truncada al
+    intervalo [a, b]. La función se tabula en una grilla de tamano tramos y se arma una tabla guía que, para cada una de
+    tamano probabilidades equiespaciadas, indica el tramo de la grilla en el que cae. Así, cada muestra se obtiene con
+    un acceso directo a la guía, un avance esperado de O(1) tramos y una interpolación lineal.
+
+    :param fda: Función de distribución acumulada de la distribución.
+    :type fda: Callable[[float], float]
+    :param a: Límite inferior del soporte considerado.
+    :type a: float
+    :param b: Límite superior del soporte considerado.
+    :type b: float
+    :param tamano: Cantidad de tramos de la grilla y de la tabla guía.
+    :type tamano: int
+    :return: Los puntos de la grilla, la función de distribución normalizada en cada punto y la tabla guía.
+    :rtype: (list[float], list[float], list[int])
+    """
+
+    if a > b:
+        a, b = b, a
+
+    # Evaluación de la función de distribución en una grilla de [a, b], normalizada y forzada a ser no decreciente
+
+    f_a, f_b = fda(a), fda(b)
+    if f_b <= f_a:
+        raise ValueError("La función de distribución no acumula probabilidad en el intervalo indicado")
+
+    lista_x = [a + i * (b - a) / tamano for i in range(tamano + 1)]
+    lista_f = []
+    maximo = 0
+    for x in lista_x:
+        maximo = min(1, max(maximo, (fda(x) - f_a) / (f_b - f_a)))
+        lista_f.append(maximo)
+    lista_f[-1] = 1
+
+    # Tabla guía: último punto de la grilla cuya probabilidad acumulada no supera j / tamano
+
+    guia = [bisect.bisect_right(lista_f, j / tamano) - 1 for j in range(tamano)]
+
+    return lista_x, lista_f, guia
+
+
+def generar_serie_tabla_inversa(n, tabla, bosquejo=None, fuente=None) -> list[float]:
+    """
+    Genera una serie de n números aleatorios por el método de la transformada inversa, usando una tabla construida con
+    construir_tabla_inversa.
+
+    :param n: Cantidad de elementos a generar en la serie.
+    :type n: int
+    :param tabla: Grilla, función de distribución normalizada y tabla guía.
+    :type tabla: (list[float], list[float], list[int])
+    :param bosquejo: Bosquejo de cuantiles al que se agregan los elementos generados.
+    :type bosquejo: BosquejoCuantiles | None
+    :param fuente: Fuente de números uniformes (ver uniformes.py). Por defecto se usa rd.random().
+    :type fuente: Callable[[int, int], list[list[float]]] | None
+    :return: Una serie de n números aleatorios con la distribución tabulada.
+    :rtype: list[float]
+    """
+
+    lista_x, lista_f, guia = tabla
+    tamano = len(guia)
+    aleatorio, = _obtener_aleatorios(n, 1, fuente)
+
+    muestras = []
+    for i in range(n):
+        u = aleatorio()
+        j = guia[int(u * tamano)]
+        while lista_f[j + 1] <= u:
+            j += 1
+        proporcion = (u - lista_f[j]) / (lista_f[j + 1] - lista_f[j])
+        x = lista_x[j] + proporcion * (lista_x[j + 1] - lista_x[j])
+        muestras.append(x)
+        if bosquejo is not None:
+            bosquejo.agregar(x)
+
+    return muestras
+
+
+def construir_tabla_alias(valores, probabilidades) -> (tuple, tuple, tuple):
+    """
+    Construye la tabla del método alias (algoritmo de Vose) para una distribución discreta arbitraria. Con la tabla,
+    cada muestra se obtiene en tiempo constante a partir de un único número aleatorio.
+
+    :param valores: Valores que puede tomar la variable.
+    :type valores: list[int]
+    :param probabilidades: Probabilidad de cada valor. Se normalizan para que sumen 1.
+    :type probabilidades: list[float]
+    :return: Los valores, la probabilidad de conservar cada casilla y el índice alternativo de cada casilla.
+    :rtype: (tuple[int], tuple[float], tuple[int])
+    """
+
+    total = sum(probabilidades)
+    if len(valores) != len(probabilidades) or total <= 0:
+        raise ValueError("Las probabilidades no corresponden a una distribución válida")
+
+    # Se reparte la probabilidad en k casillas de altura 1: cada casilla conserva parte de su propio valor y completa el
+    # resto con el de una casilla que excede la altura.
+
+    k = len(probabilidades)
+    escaladas = [p * k / total for p in probabilidades]
+    tabla_prob = [1.0] * k
+    tabla_alias = list(range(k))
+
+    pequenas = [i for i in range(k) if escaladas[i] < 1]
+    grandes = [i for i in range(k) if escaladas[i] >= 1]
+
+    while pequenas and grandes:
+        chica = pequenas.pop()
+        grande = grandes.pop()
+        tabla_prob[chica] = escaladas[chica]
+        tabla_alias[chica] = grande
+        escaladas[grande] += escaladas[chica] - 1
+        if escaladas[grande] < 1:
+            pequenas.append(grande)
+        else:
+            grandes.append(grande)
+
+    return tuple(valores), tuple(tabla_prob), tuple(tabla_alias)
+
+
+@functools.lru_cache(maxsize=32)
+def tabla_alias_discreta(valores, probabilidades) -> (tuple, tuple, tuple, tuple):
+    """
+    Construye, o recupera de la caché, la tabla alias de una distribución discreta dada por sus valores y
+    probabilidades.
+
+    :param valores: Valores que puede tomar la variable.
+    :type valores: tuple[int]
+    :param probabilidades: Probabilidad de cada valor.
+    :type probabilidades: tuple[float]
+    :return: Los valores, sus probabilidades y la tabla alias correspondiente.
+    :rtype: (tuple[int], tuple[float], tuple[float], tuple[int])
+    """
+
+    return (tuple(valores), tuple(probabilidades)) + construir_tabla_alias(valores, probabilidades)[1:]
+
+
+@functools.lru_cache(maxsize=32)
+def tabla_alias_poisson(lam, desvios=10) -> (tuple, tuple, tuple, tuple):
+    """
+    Construye, o recupera de la caché, la tabla alias de una distribución de Poisson truncada a lam ± desvios
+    desviaciones estándar.
+
+    :param lam: El valor Lambda de la distribución.
+    :type lam: float
+    :param desvios: Cantidad de desviaciones estándar a cada lado de la media que abarca la tabla.
+    :type desvios: float
+    :return: Los valores, sus probabilidades y la tabla alias correspondiente.
+    :rtype: (tuple[int], tuple[float], tuple[float], tuple[int])
+    """
+
+    if lam < 0:
+        raise ValueError("Lambda debe ser mayor o igual a 0")
+
+    # Con lam = 0 toda la probabilidad se concentra en el 0
+
+    if lam == 0:
+        return tabla_alias_discreta((0,), (1.0,))
+
+    minimo = max(0, math.floor(lam - desvios * math.sqrt(lam) - desvios))
+    maximo = math.ceil(lam + desvios * math.sqrt(lam) + desvios)
+
+    valores = list(range(minimo, maximo + 1))
+    probabilidades = [math.exp(k * math.log(lam) - lam - math.lgamma(k + 1)) for k in valores]
+    total = sum(probabilidades)
+    probabilidades = [p / total for p in probabilidades]
+
+    return tabla_alias_discreta(tuple(valores), tuple(probabilidades))
+
+
+@functools.lru_cache(maxsize=32)
+def tabla_alias_binomial(ensayos, p) -> (tuple, tuple, tuple, tuple):
+    """
+    Construye, o recupera de la caché, la tabla alias de una distribución binomial.
+
+    :param ensayos: Cantidad de ensayos de la distribución.
+    :type ensayos: int
+    :param p: Probabilidad de éxito de cada ensayo.
+    :type p: float
+    :return: Los valores, sus probabilidades y la tabla alias correspondiente.
+    :rtype: (tuple[int], tuple[float], tuple[float], tuple[int])
+    """
+
+    valores = list(range(ensayos + 1))
+    if p <= 0 or p >= 1:
+        probabilidades = [1.0 if k == round(p * ensayos) else 0.0 for k in valores]
+    else:
+        probabilidades = [math.exp(math.lgamma(ensayos + 1) - math.lgamma(k + 1) - math.lgamma(ensayos - k + 1)
+                                   + k * math.log(p) + (ensayos - k) * math.log(1 - p)) for k in valores]
+
+    return tabla_alias_discreta(tuple(valores), tuple(probabilidades))
+
+
+def tabla_alias_empirica(muestras) -> (tuple, tuple, tuple, tuple):
+    """
+    Construye la tabla alias de la distribución empírica de una muestra.
+
+    :param muestras: La muestra observada.
+    :type muestras: list[int]
+    :return: Los valores, sus probabilidades y la tabla alias correspondiente.
+    :rtype: (tuple[int], tuple[float], tuple[float], tuple[int])
+    """
+
+    conteo = {}
+    for x in muestras:
+        conteo[x] = conteo.get(x, 0) + 1
+
+    valores = sorted(conteo)
+    probabilidades = [conteo[x] / len(muestras) for x in valores]
+
+    return tabla_alias_discreta(tuple(valores), tuple(probabilidades))
+
+
+def generar_serie_alias(n, tabla, fuente=None) -> list[int]:
+    """
+    Genera una serie de n números aleatorios de una distribución discreta usando el método alias.
+
+    :param n: Cantidad de elementos a generar en la serie.
+    :type n: int
+    :param tabla: Tabla construida con alguna de las funciones tabla_alias_*.
+    :type tabla: (tuple[int], tuple[float], tuple[float], tuple[int])
+    :param fuente: Fuente de números uniformes (ver uniformes.py). Por defecto se usa rd.random().
+    :type fuente: Callable[[int, int], list[list[float]]] | None
+    :return: Una serie de n números aleatorios con la distribución de la tabla.
+    :rtype: list[int]
+    """
+
+    valores, _, tabla_prob, tabla_alias = tabla
+    k = len(valores)
+    aleatorio, = _obtener_aleatorios(n, 1, fuente)
+
+    serie = []
+    for i in range(n):
+        u = aleatorio() * k
+        j = int(u)
+        if u - j < tabla_prob[j]:
+            serie.append(valores[j])
+        else:
+            serie.append(valores[tabla_alias[j]])
+    return serie
+
+
 # =====================================================================================================================
 #
 # CÁLCULOS DE FRECUENCIA OBSERVADA Y ESPERADA
@@ -185,6 +472,82 @@ def generar_intervalos_dist_discreta(muestras) -> (list[int], list[int]):
     return lista_marca, lista_frec_observada
 
 
+def generar_limites_freedman_diaconis(bosquejo, max_intervalos=1000) -> list[float]:
+    """
+    Genera los límites de intervalos de igual amplitud según la regla de Freedman–Diaconis, con amplitud
+    2 * RIC / n^(1/3), a partir de un bosquejo de cuantiles de la serie.
+
+    :param bosquejo: Bosquejo de cuantiles de la serie.
+    :type bosquejo: BosquejoCuantiles
+    :param max_intervalos: Cantidad máxima de intervalos a generar.
+    :type max_intervalos: int
+    :return: Los límites de los intervalos, de menor a mayor (uno más que la cantidad de intervalos).
+    :rtype: list[float]
+    """
+
+    # Cálculos iniciales
+
+    minimo, maximo = bosquejo.minimo, bosquejo.maximo
+    q1, q3 = bosquejo.cuantiles([0.25, 0.75])
+    amplitud = 2 * (q3 - q1) / bosquejo.n ** (1 / 3)
+
+    if amplitud > 0:
+        cant_intervalos = min(max(1, math.ceil((maximo - minimo) / amplitud)), max_intervalos)
+    else:
+        cant_intervalos = 1
+    rango = (maximo - minimo) / cant_intervalos
+
+    # Generación de límites
+
+    lista_limites = [minimo + i * rango for i in range(cant_intervalos)]
+    lista_limites.append(maximo)
+
+    return lista_limites
+
+
+def generar_limites_equiprobables(bosquejo, cant_intervalos) -> list[float]:
+    """
+    Genera los límites de intervalos con igual frecuencia observada esperada, ubicados en los cuantiles estimados por
+    un bosquejo de cuantiles de la serie.
+
+    :param bosquejo: Bosquejo de cuantiles de la serie.
+    :type bosquejo: BosquejoCuantiles
+    :param cant_intervalos: Cantidad de intervalos a generar.
+    :type cant_intervalos: int
+    :return: Los límites de los intervalos, de menor a mayor (uno más que la cantidad de intervalos).
+    :rtype: list[float]
+    """
+
+    lista_q = [i / cant_intervalos for i in range(1, cant_intervalos)]
+    lista_limites = [bosquejo.minimo] + bosquejo.cuantiles(lista_q) + [bosquejo.maximo]
+
+    # Se descartan los límites repetidos, que producirían intervalos vacíos
+
+    return sorted(set(lista_limites))
+
+
+def generar_intervalos_desde_limites(muestras, lista_limites) -> (list[float], list[float], list[float], list[int]):
+
+    # Generación de listas de límite inferior, superior y marcas
+
+    lista_li = lista_limites[:-1]
+    lista_ls = lista_limites[1:]
+    lista_marca = [(lista_ls[i] + lista_li[i]) / 2 for i in range(len(lista_li))]
+
+    # Generación de lista de frecuencia observada. Cada muestra se ubica por búsqueda binaria sobre los límites
+    # interiores, y los valores fuera del rango se asignan al primer o último intervalo.
+
+    interiores = lista_limites[1:-1]
+    lista_frec_observada = [0] * len(lista_li)
+
+    for i in muestras:
+        lista_frec_observada[bisect.bisect_right(interiores, i)] += 1
+
+    # Retornos
+
+    return lista_li, lista_ls, lista_marca, lista_frec_observada
+
+
 def calcular_frecuencia_esperada_uniforme(cant_muestras, cant_intervalos) -> list[float]:
 
     # Generación de lista de frecuencia esperada
@@ -196,6 +559,23 @@ def calcular_frecuencia_esperada_uniforme(cant_muestras, cant_intervalos) -> lis
     return lista_frec_esperada
 
 
+def calcular_frecuencia_esperada_uniforme_limites(lista_li, lista_ls, cant_muestras) -> list[float]:
+
+    # Cálculos iniciales
+
+    rango = lista_ls[-1] - lista_li[0]
+
+    # Generación de lista de frecuencia esperada, proporcional a la amplitud de cada intervalo
+
+    lista_frec_esperada = []
+    for i in range(len(lista_li)):
+        lista_frec_esperada.append((lista_ls[i] - lista_li[i]) / rango * cant_muestras)
+
+    # Retorno
+
+    return lista_frec_esperada
+
+
 def calcular_frecuencia_esperada_normal(lista_li, lista_ls, lista_marca, cant_muestras, media, desv_est) -> list[float]:
 
     # Generación de lista de frecuencia esperada
@@ -212,6 +592,22 @@ def calcular_frecuencia_esperada_normal(lista_li, lista_ls, lista_marca, cant_mu
     return lista_frec_esperada
 
 
+def calcular_frecuencia_esperada_normal_acumulada(lista_li, lista_ls, cant_muestras, media, desv_est) -> list[float]:
+
+    # Generación de lista de frecuencia esperada a partir de la función de distribución acumulada, ya que con
+    # intervalos de amplitud variable la aproximación por la densidad en la marca de clase deja de ser válida
+
+    lista_frec_esperada = []
+    for i in range(len(lista_li)):
+        f_ls = (1 + math.erf((lista_ls[i] - media) / (desv_est * math.sqrt(2)))) / 2
+        f_li = (1 + math.erf((lista_li[i] - media) / (desv_est * math.sqrt(2)))) / 2
+        lista_frec_esperada.append((f_ls - f_li) * cant_muestras)
+
+    # Retorno
+
+    return lista_frec_esperada
+
+
 def calcular_frecuencia_esperada_exp_neg(lista_li, lista_ls, cant_muestras, media) -> list[float]:
 
     # Cálculos iniciales
@@ -230,6 +626,27 @@ def calcular_frecuencia_esperada_exp_neg(lista_li, lista_ls, cant_muestras, medi
     return lista_frec_esperada
 
 
+def calcular_frecuencia_esperada_fda(lista_li, lista_ls, cant_muestras, fda, a, b) -> list[float]:
+
+    # Cálculos iniciales. La distribución se considera truncada a [a, b], igual que en construir_tabla_inversa
+
+    if a > b:
+        a, b = b, a
+    f_a, f_b = fda(a), fda(b)
+
+    # Generación de lista de frecuencia esperada
+
+    lista_frec_esperada = []
+    for i in range(len(lista_li)):
+        f_ls = fda(min(max(lista_ls[i], a), b))
+        f_li = fda(min(max(lista_li[i], a), b))
+        lista_frec_esperada.append((f_ls - f_li) / (f_b - f_a) * cant_muestras)
+
+    # Retorno
+
+    return lista_frec_esperada
+
+
 def calcular_frecuencia_esperada_poisson(lista_marca, lam, cant_muestras) -> list[float]:
 
     # Generación de lista de frecuencias esperadas
@@ -244,6 +661,23 @@ def calcular_frecuencia_esperada_poisson(lista_marca, lam, cant_muestras) -> lis
     return lista_frec_esperada
 
 
+def calcular_frecuencia_esperada_discreta(lista_marca, valores, probabilidades, cant_muestras) -> list[float]:
+
+    # Cálculos iniciales
+
+    probabilidad_de = dict(zip(valores, probabilidades))
+
+    # Generación de lista de frecuencias esperadas
+
+    lista_frec_esperada = []
+    for n in lista_marca:
+        lista_frec_esperada.append(probabilidad_de.get(n, 0) * cant_muestras)
+
+    # Retorno
+
+    return lista_frec_esperada
+
+
 # =====================================================================================================================
 #
 # PRUEBAS DE BONDAD DE AJUSTE
@@ -254,29 +688,33 @@ def calcular_chi2(lista_frec_observada, lista_frec_esperada, distribucion) -> (f
 
     # Agrupamiento de frecuencias de forma que cada valor de frecuencias esperadas sea >= 5:
 
-    nuevo_fo = []
-    nuevo_fe = []
+    if compilado.DISPONIBLE:
+        nuevo_fo, nuevo_fe = compilado.agrupar_frecuencias(lista_frec_observada, lista_frec_esperada)
+
+    else:
+        nuevo_fo = []
+        nuevo_fe = []
+
+        acum_fe = 0
+        acum_fo = 0
 
-    acum_fe = 0
-    acum_fo = 0
+        for i in range(len(lista_frec_esperada)):
 
-    for i in range(len(lista_frec_esperada)):
+            acum_fe += lista_frec_esperada[i]
+            acum_fo += lista_frec_observada[i]
 
-        acum_fe += lista_frec_esperada[i]
-        acum_fo += lista_frec_observada[i]
+            if acum_fe >= 5:
+                nuevo_fe.append(acum_fe)
+                nuevo_fo.append(acum_fo)
+                acum_fe = 0
+                acum_fo = 0
 
-        if acum_fe >= 5:
+        if not nuevo_fe:
             nuevo_fe.append(acum_fe)
             nuevo_fo.append(acum_fo)
-            acum_fe = 0
-            acum_fo = 0
-
-    if not nuevo_fe:
-        nuevo_fe.append(acum_fe)
-        nuevo_fo.append(acum_fo)
-    elif acum_fo > 0 or acum_fe > 0:
-        nuevo_fe[-1] += acum_fe
-        nuevo_fo[-1] += acum_fo
+        elif acum_fo > 0 or acum_fe > 0:
+            nuevo_fe[-1] += acum_fe
+            nuevo_fo[-1] += acum_fo
 
     lista_frec_observada = nuevo_fo
     lista_frec_esperada = nuevo_fe
@@ -289,7 +727,7 @@ def calcular_chi2(lista_frec_observada, lista_frec_esperada, distribucion) -> (f
 
     # Chi-Cuadrado tabulado:
 
-    m = {"U": 0, "EN": 1, "N": 2, "P": 1}
+    m = {"U": 0, "EN": 1, "N": 2, "P": 1, "FDA": 0, "B": 0, "E": 0}
     k = len(lista_frec_observada)
     try:
         grados_libertad = k - 1 - m[distribucion]
@@ -311,13 +749,17 @@ def calcular_ks(lista_frec_observada, lista_frec_esperada) -> (float, float, flo
 
     # K-S calculado:
 
-    ks_calculado = po_acum = pe_acum = 0
-    for i in range(len(lista_frec_observada)):
-        po_acum += lista_frec_observada[i] / cant_muestras
-        pe_acum += lista_frec_esperada[i] / cant_muestras
-        dif = abs(po_acum - pe_acum)
-        if dif > ks_calculado:
-            ks_calculado = dif
+    if compilado.DISPONIBLE:
+        ks_calculado = compilado.calcular_ks_calculado(lista_frec_observada, lista_frec_esperada, cant_muestras)
+
+    else:
+        ks_calculado = po_acum = pe_acum = 0
+        for i in range(len(lista_frec_observada)):
+            po_acum += lista_frec_observada[i] / cant_muestras
+            pe_acum += lista_frec_esperada[i] / cant_muestras
+            dif = abs(po_acum - pe_acum)
+            if dif > ks_calculado:
+                ks_calculado = dif
 
     # K-S tabulado:
 
@@ -327,3 +769,58 @@ def calcular_ks(lista_frec_observada, lista_frec_esperada) -> (float, float, flo
     # Retornos
 
     return ks_calculado, ks_tabulado, nivel_de_confianza
+
+
+# =====================================================================================================================
+#
+# CONVERGENCIA
+#
+# =====================================================================================================================
+
+def comparar_convergencia(generar_serie, fda, lista_limites, tamanos, fuentes,
+                          repeticiones=5) -> dict[str, list[float]]:
+    """
+    Compara la convergencia del histograma generado con distintas fuentes de números uniformes. Para cada fuente y
+    tamaño de muestra se mide la máxima diferencia entre la frecuencia relativa acumulada observada y la función de
+    distribución en los límites interiores de los intervalos, promediada sobre varias repeticiones.
+
+    :param generar_serie: Función que genera una serie dado su tamaño y la fuente de números uniformes.
+    :type generar_serie: Callable[[int, Callable | None], list[float]]
+    :param fda: Función de distribución acumulada de la hipótesis nula.
+    :type fda: Callable[[float], float]
+    :param lista_limites: Los límites de los intervalos, de menor a mayor.
+    :type lista_limites: list[float]
+    :param tamanos: Tamaños de muestra a evaluar.
+    :type tamanos: list[int]
+    :param fuentes: Fuentes de números uniformes a comparar, por nombre.
+    :type fuentes: dict[str, Callable | None]
+    :param repeticiones: Cantidad de series generadas por cada fuente y tamaño.
+    :type repeticiones: int
+    :return: El error medio de cada fuente para cada tamaño de muestra.
+    :rtype: dict[str, list[float]]
+    """
+
+    # Cálculos iniciales
+
+    interiores = lista_limites[1:-1]
+    lista_f = [fda(x) for x in interiores]
+
+    # Cálculo del error medio por fuente y tamaño
+
+    errores = {}
+    for nombre, fuente in fuentes.items():
+        errores[nombre] = []
+        for n in tamanos:
+            suma_errores = 0
+            for r in range(repeticiones):
+                lista_fo = generar_intervalos_desde_limites(generar_serie(n, fuente), lista_limites)[3]
+                fo_acum = error = 0
+                for i in range(len(interiores)):
+                    fo_acum += lista_fo[i]
+                    error = max(error, abs(fo_acum / n - lista_f[i]))
+                suma_errores += error
+            errores[nombre].append(suma_errores / repeticiones)
+
+    # Retorno
+
+    return errores
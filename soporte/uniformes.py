@@ -0,0 +1,100 @@
+import math
+import random as rd
+from scipy.stats import qmc
+
+
+# =====================================================================================================================
+#
+# FUENTES DE NÚMEROS UNIFORMES
+#
+# =====================================================================================================================
+
+# Cada fuente genera n puntos en el hipercubo [0, 1)^dimensiones y los devuelve por columnas: una lista de n números
+# por cada dimensión. Los generadores de simulacion.py transforman estos números igual que a los obtenidos con
+# rd.random(), por lo que la distribución generada no cambia, pero el error de muestreo disminuye. Todas las fuentes
+# toman su aleatoriedad del módulo random, de forma que respetan la semilla fijada con rd.seed().
+
+def uniformes_aleatorios(n, dimensiones) -> list[list[float]]:
+    """
+    Genera n puntos uniformes independientes, equivalentes a llamar a rd.random() en cada coordenada.
+
+    :param n: Cantidad de puntos a generar.
+    :type n: int
+    :param dimensiones: Cantidad de coordenadas de cada punto.
+    :type dimensiones: int
+    :return: Una lista de n números por cada dimensión.
+    :rtype: list[list[float]]
+    """
+
+    return [[rd.random() for i in range(n)] for d in range(dimensiones)]
+
+
+def uniformes_estratificados(n, dimensiones) -> list[list[float]]:
+    """
+    Genera n puntos estratificando la primera coordenada: el intervalo [0, 1) se divide en n estratos de igual
+    amplitud y se toma un número al azar dentro de cada uno. El resto de las coordenadas son independientes.
+
+    :param n: Cantidad de puntos a generar.
+    :type n: int
+    :param dimensiones: Cantidad de coordenadas de cada punto.
+    :type dimensiones: int
+    :return: Una lista de n números por cada dimensión.
+    :rtype: list[list[float]]
+    """
+
+    estratificada = [(i + rd.random()) / n for i in range(n)]
+    rd.shuffle(estratificada)
+
+    return [estratificada] + uniformes_aleatorios(n, dimensiones - 1)
+
+
+def uniformes_hipercubo_latino(n, dimensiones) -> list[list[float]]:
+    """
+    Genera n puntos por muestreo de hipercubo latino: cada coordenada se estratifica en n estratos y los estratos de
+    las distintas coordenadas se combinan mediante permutaciones al azar independientes.
+
+    :param n: Cantidad de puntos a generar.
+    :type n: int
+    :param dimensiones: Cantidad de coordenadas de cada punto.
+    :type dimensiones: int
+    :return: Una lista de n números por cada dimensión.
+    :rtype: list[list[float]]
+    """
+
+    columnas = []
+    for d in range(dimensiones):
+        columna = [(i + rd.random()) / n for i in range(n)]
+        rd.shuffle(columna)
+        columnas.append(columna)
+
+    return columnas
+
+
+def uniformes_sobol(n, dimensiones) -> list[list[float]]:
+    """
+    Genera n puntos de una secuencia de Sobol aleatorizada (scrambling de Owen). La secuencia se genera hasta la
+    siguiente potencia de 2 y se toman sus primeros n puntos.
+
+    :param n: Cantidad de puntos a generar.
+    :type n: int
+    :param dimensiones: Cantidad de coordenadas de cada punto.
+    :type dimensiones: int
+    :return: Una lista de n números por cada dimensión.
+    :rtype: list[list[float]]
+    """
+
+    if n == 0:
+        return [[] for d in range(dimensiones)]
+
+    motor = qmc.Sobol(dimensiones, scramble=True, seed=rd.getrandbits(32))
+    puntos = motor.random_base2(math.ceil(math.log2(n)))[:n]
+
+    return puntos.T.tolist()
+
+
+FUENTES = {
+    "A": uniformes_aleatorios,
+    "ES": uniformes_estratificados,
+    "HL": uniformes_hipercubo_latino,
+    "SB": uniformes_sobol,
+}